@@ -1,7 +1,8 @@
 import asyncio
+import math
 import random
 from datetime import timedelta
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 import discord  # type: ignore
 from discord import utils as discord_utils  # type: ignore
@@ -43,9 +44,9 @@ class GiveawayManaging(vbu.Cog):
         giveaway_message = await ctx.channel.send(
             "Created a giveaway\nEnding: "
             f" {discord_utils.format_dt(giveaway_ends_at, style='R')}!"
-            f" Reward: {giveaway_reward or 'nothing lol'}"
+            f" Reward: {giveaway_reward.mention if giveaway_reward else 'nothing lol'}",
+            allowed_mentions=discord.AllowedMentions.none(),
         )
-        await giveaway_message.add_reaction("🎉")
         giveaway = utils.Giveaway(
             ctx.guild.id,
             ctx.channel.id,
@@ -56,8 +57,28 @@ class GiveawayManaging(vbu.Cog):
         if giveaway_reward:
             giveaway.role_rewards = [giveaway_reward]
 
-        async with vbu.DatabaseConnection() as db:
-            await giveaway.update(db)
+        # The reaction and the database entry don't depend on each other.
+        # NOTE: Both have to finish before the connection is given back to the
+        #       pool, so errors are only raised once they're done.
+        async with self.bot.database() as db:
+            reaction_result, update_result = await asyncio.gather(
+                giveaway_message.add_reaction(utils.GIVEAWAY_EMOJI),
+                giveaway.update(db),
+                return_exceptions=True,
+            )
+
+        # Schedule the giveaway as long as it was saved, even if the reaction
+        # couldn't be added.
+        if isinstance(update_result, Exception):
+            raise update_result
+
+        # Let the scheduler know, this giveaway might be the next one to end.
+        tasks_cog = self.bot.get_cog("Tasks")
+        if tasks_cog is not None:
+            tasks_cog.reschedule_giveaways()
+
+        if isinstance(reaction_result, Exception):
+            raise reaction_result
 
     @commands.command(
         name="active-giveaways",
@@ -83,12 +104,14 @@ class GiveawayManaging(vbu.Cog):
         None
         """
 
-        async with vbu.DatabaseConnection() as db:
-            giveaways = (
-                await utils.get_giveaways(db, channel=channel)
-                if channel is not None
-                else await utils.get_giveaways(db, guild=ctx.guild)
-            )
+        # Fetch the giveaways a page at a time, using the last giveaway of the
+        # previous page as the cursor for the next one.
+        per_page = 5
+        giveaway_filter = (
+            {"channel": channel} if channel is not None else {"guild": ctx.guild}
+        )
+        async with self.bot.database() as db:
+            giveaways = await utils.get_giveaways(db, **giveaway_filter, limit=per_page)
 
         if not giveaways:
             if channel is None:
@@ -106,7 +129,41 @@ class GiveawayManaging(vbu.Cog):
                     )
             return
 
+        # Only count the giveaways if there might be more than one page.
+        if len(giveaways) < per_page:
+            total_pages = 1
+        else:
+            async with self.bot.database() as db:
+                total = await utils.count_giveaways(db, **giveaway_filter)
+            total_pages = max(math.ceil(total / per_page), 1)
+
         # Paginate the active giveaways.
+        pages: Dict[int, List[utils.Giveaway]] = {0: giveaways}
+
+        async def get_page(page_number: int) -> List[utils.Giveaway]:
+            try:
+                return pages[page_number]
+            except KeyError:
+                pass
+
+            # A short page means there's nothing after it, so don't bother
+            # asking the database.
+            previous_page = pages[page_number - 1]
+            if len(previous_page) < per_page:
+                raise StopAsyncIteration
+
+            async with self.bot.database() as db:
+                page = await utils.get_giveaways(
+                    db,
+                    **giveaway_filter,
+                    limit=per_page,
+                    after=previous_page[-1],
+                )
+            if not page:
+                raise StopAsyncIteration
+            pages[page_number] = page
+            return page
+
         def formatter(
             menu: vbu.Paginator, giveaways: List[utils.Giveaway]
         ) -> discord.Embed:
@@ -118,15 +175,29 @@ class GiveawayManaging(vbu.Cog):
                 colour=discord.colour.Colour.green(),
             ) as embed:
                 for giveaway in giveaways:
+                    # NOTE: Mentions don't render in field names, so the
+                    #       rewards go in the value.
+                    rewards = ", ".join(
+                        reward.mention for reward in giveaway.role_rewards or []
+                    )
                     embed.add_field(
-                        f"{giveaway.role_rewards}",
-                        f"[Jump!]({giveaway.message_url})  Ending: {discord_utils.format_dt(giveaway.ends_at, style='R')}",
+                        "Giveaway",
+                        f"Reward: {rewards or 'nothing lol'}\n"
+                        f"[Jump!]({giveaway.message_url})  Ending: {giveaway.ends_at_relative}",
                         inline=False,
                     )
-                embed.set_footer(f"Page {menu.current_page + 1}/{menu.max_pages}")
+                embed.set_footer(
+                    f"Page {menu.current_page + 1}/"
+                    f"{total_pages if menu.max_pages == '?' else menu.max_pages}"
+                )
             return embed
 
-        paginator = vbu.Paginator(giveaways, per_page=5, formatter=formatter)
+        # A short first page is the only page, so hand it over as a list and
+        # the paginator knows there's nothing else to fetch.
+        if len(giveaways) < per_page:
+            paginator = vbu.Paginator(giveaways, per_page=per_page, formatter=formatter)
+        else:
+            paginator = vbu.Paginator(get_page, formatter=formatter)
         await paginator.start(ctx)
 
 
@@ -5,6 +5,18 @@ import discord  # type: ignore
 from discord.ext import commands, vbu  # type: ignore
 
 
+# NOTE: keep `_FAST_PING_ROWS` and `_FAST_PING_COLUMNS` lower than the 5,
+#       since that's the maxiumum.
+_FAST_PING_ROWS = 5
+_FAST_PING_COLUMNS = 5
+# NOTE: These are only the ends of the buttons' custom IDs, each command
+#       prefixes them with its own interaction ID.
+_FAST_PING_BUTTON_SUFFIXES = [
+    [f"_{x_index}_{y_index}" for x_index in range(_FAST_PING_COLUMNS)]
+    for y_index in range(_FAST_PING_ROWS)
+]
+
+
 class PingCommand(vbu.Cog):
     @commands.command(name="ping")
     @commands.is_slash_command()
@@ -22,29 +34,35 @@ class PingCommand(vbu.Cog):
         Fast ping! Quickly press the green button.
         """
 
-        # NOTE: keep `rows` and `columns` lower than the 5, since that's the
-        #       maxiumum.
-        rows = 5
-        columns = 5
-        pong_coordinates = random.randrange(0, rows), random.randrange(0, columns)
+        # Pick the pong button's coordinates with a single draw.
+        pong_y, pong_x = divmod(
+            random.randrange(_FAST_PING_ROWS * _FAST_PING_COLUMNS), _FAST_PING_COLUMNS
+        )
+        # Every button gets the interaction's ID so clicks on another
+        # fast-ping can't be mistaken for clicks on this one.
+        custom_id_prefix = f"PONG_{ctx.interaction.id}"
+        pong_custom_id = custom_id_prefix + _FAST_PING_BUTTON_SUFFIXES[pong_y][pong_x]
         components = discord.ui.MessageComponents()
 
         # Add action rows for every row and buttons for every column.
-        for y_index in range(rows):
+        # NOTE: The buttons are built fresh every time since disabling them at
+        #       the end mutates them.
+        for row_suffixes in _FAST_PING_BUTTON_SUFFIXES:
             action_row = discord.ui.ActionRow()
-            for x_index in range(columns):
+            for suffix in row_suffixes:
+                custom_id = custom_id_prefix + suffix
 
                 # Special button at the pong coordinates.
-                if (x_index, y_index) == pong_coordinates:
+                if custom_id == pong_custom_id:
                     button = discord.ui.Button(
                         label="Pong!",
-                        custom_id=f"PONG_{x_index}_{y_index}",
+                        custom_id=custom_id,
                         style=discord.ui.ButtonStyle.success,
                     )
                 else:
                     button = discord.ui.Button(
                         label="ping",
-                        custom_id=f"PONG_{x_index}_{y_index}",
+                        custom_id=custom_id,
                         style=discord.ui.ButtonStyle.danger,
                     )
 
@@ -58,16 +76,12 @@ class PingCommand(vbu.Cog):
             ephemeral=True,
         )
 
-        # NOTE: This is required for the check_pong_component_interaction to
-        #       work.
-        original_message = await ctx.interaction.original_message()
-
+        # NOTE: Matching on the custom ID means we don't need to fetch the
+        #       original message just to compare IDs.
         def check_pong_component_interaction(interaction: discord.Interaction) -> bool:
-            if interaction.user != ctx.author:
-                return False
-            if not interaction.message or interaction.message.id != original_message.id:
-                return False
-            return True
+            return interaction.user.id == ctx.author.id and (
+                interaction.custom_id or ""
+            ).startswith(f"{custom_id_prefix}_")
 
         try:
             pong_component_interaction: discord.Interaction = await self.bot.wait_for(
@@ -77,10 +91,7 @@ class PingCommand(vbu.Cog):
             )
 
             # Pong button?
-            if (
-                pong_component_interaction.custom_id
-                == f"PONG_{pong_coordinates[0]}_{pong_coordinates[1]}"
-            ):
+            if pong_component_interaction.custom_id == pong_custom_id:
                 await pong_component_interaction.response.send_message(
                     "Good job! Pong!", ephemeral=True
                 )
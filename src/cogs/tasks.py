@@ -4,35 +4,102 @@ from datetime import timedelta
 from typing import Optional, List
 
 import discord  # type: ignore
-from discord import utils as discord_utils
-from discord.ext import tasks, vbu  # type: ignore
+from discord.ext import vbu  # type: ignore
 
 from . import utils
 
 
+# The longest, in seconds, the giveaway scheduler sleeps before checking the
+# database again. Giveaways saved without `reschedule_giveaways` being called
+# (by another process, say) are picked up within this long.
+GIVEAWAY_SCHEDULER_MAX_SLEEP = 60
+
+
 class Tasks(vbu.Cog):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._giveaway_checker.start()
+        self._wakeup = asyncio.Event()
+        self._giveaway_scheduler_task = self.bot.loop.create_task(
+            self._giveaway_scheduler()
+        )
+
+    def cog_unload(self) -> None:
+        self._giveaway_scheduler_task.cancel()
+
+    def reschedule_giveaways(self) -> None:
+        """
+        Wake the giveaway scheduler so it picks up a giveaway that may now be
+        the next one to end.
+        """
 
-    @tasks.loop(seconds=5.0)
-    async def _giveaway_checker(self) -> None:
+        self._wakeup.set()
+
+    async def _giveaway_scheduler(self) -> None:
         """
-        The giveaway checker loop. This loop checks for active giveaways and
-        ends them if necessary.
+        The giveaway scheduler. Sleeps until the soonest giveaway ends (or
+        until it's woken up by `reschedule_giveaways`) and ends every giveaway
+        that's due.
         """
 
         # Bot needs  to be ready for some internal operations to be
         # performed, namely cache-related ones like `bot.get_channel`.
-        if not self.bot.is_ready():
+        await self.bot.wait_until_ready()
+
+        while True:
+            # NOTE: Any error (like the database being unreachable) is logged
+            #       and retried shortly after, rather than killing the
+            #       scheduler and leaving every giveaway running forever.
+            try:
+                await self._schedule_giveaways()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Giveaway scheduler failed", exc_info=e)
+                await asyncio.sleep(5)
+
+    async def _schedule_giveaways(self) -> None:
+        """
+        Sleep until the soonest giveaway ends (or until the scheduler is woken
+        up) and end every giveaway that's due.
+        """
+
+        self._wakeup.clear()
+        async with self.bot.database() as db:
+            delay = await utils.get_next_giveaway_delay(db)
+
+        # Sleep until the giveaway ends, or until a giveaway is created if
+        # there's nothing to end.
+        # NOTE: The sleep is capped so giveaways the scheduler wasn't told
+        #       about are still noticed.
+        if delay is None or delay > GIVEAWAY_SCHEDULER_MAX_SLEEP:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=GIVEAWAY_SCHEDULER_MAX_SLEEP
+                )
+            except asyncio.TimeoutError:
+                pass
+            return
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 0))
             return
+        except asyncio.TimeoutError:
+            pass
 
-        async with vbu.DatabaseConnection() as db:
-            giveaways = await utils.get_giveaways(db)
-            if giveaways is not None:
-                for giveaway in giveaways:
-                    if giveaway.ends_at <= discord_utils.utcnow():
-                        await giveaway.end(db, self.bot)
+        # End every giveaway that's due in one go, then announce the
+        # winners concurrently.
+        async with self.bot.database() as db:
+            expired = await utils.pop_expired(db)
+        results = await asyncio.gather(
+            *(giveaway.announce_winner(self.bot) for giveaway in expired),
+            return_exceptions=True,
+        )
+        for giveaway, result in zip(expired, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    f"Failed to announce the winner of {giveaway._id}",
+                    exc_info=result,
+                )
 
 
 def setup(bot: vbu.Bot):
@@ -1,8 +1,18 @@
 from .giveaway import (
+    MAX_GIVEAWAYS_LIMIT,
+    COUNT_GIVEAWAYS_TIMEOUT,
+    GIVEAWAYS_CACHE_TTL,
+    GIVEAWAYS_CACHE_SIZE,
+    BULK_UPDATE_COPY_THRESHOLD,
+    GIVEAWAY_EMOJI,
     GiveawayRoleRewardDict,
     GiveawayRoleReward,
     GiveawayDict,
     Giveaway,
     get_giveaway,
+    get_next_giveaway_delay,
     get_giveaways,
+    iter_giveaways,
+    pop_expired,
+    count_giveaways,
 )
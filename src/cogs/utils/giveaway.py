@@ -1,14 +1,159 @@
 from __future__ import annotations
 
+import asyncio
 import random
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TypedDict, Optional, List, Union, overload
-
+from typing import (
+    TypedDict,
+    Any,
+    AsyncIterator,
+    Optional,
+    List,
+    Sequence,
+    Dict,
+    Tuple,
+    Union,
+    overload,
+)
+
+import asyncpg  # type: ignore
 import discord  # type: ignore
+from discord import utils as discord_utils  # type: ignore
 from discord.ext import vbu  # type: ignore
 
 
+# The most giveaways that `get_giveaways` will fetch at once.
+MAX_GIVEAWAYS_LIMIT = 100
+
+# How long `count_giveaways` may spend counting before falling back to an
+# estimate.
+COUNT_GIVEAWAYS_TIMEOUT = "200ms"
+
+# How long, in seconds, `get_giveaways` results are cached for, and how many
+# results are kept at once.
+GIVEAWAYS_CACHE_TTL = 5.0
+GIVEAWAYS_CACHE_SIZE = 1024
+
+# How many giveaways `Giveaway.bulk_update` will insert with `executemany`
+# before switching to COPY.
+BULK_UPDATE_COPY_THRESHOLD = 1000
+
+# Winners are drawn from the OS' randomness rather than the module-level
+# Mersenne Twister, which is shared with everything else in the process (like
+# the fast-ping button) and can be predicted from enough of its output.
+_winner_random = random.SystemRandom()
+
+# The reaction people use to enter a giveaway. This is both added to new
+# giveaways and looked for when they end, so the two can't drift apart. It's
+# spelt as an escape so it can't be broken by the file's encoding.
+GIVEAWAY_EMOJI = "\U0001F389"
+
+# NOTE: The SQL for the hot paths lives here so every caller sends the exact
+#       same text, which is what asyncpg's prepared statement cache is keyed on.
+_SELECT_GIVEAWAY_BY_ID_SQL = """
+SELECT
+    guild_id,
+    channel_id,
+    message_id,
+    ends_at,
+    ARRAY(
+        SELECT role_id
+        FROM giveaway_role_rewards
+        WHERE giveaway_id = giveaways.id
+    ) AS role_ids
+FROM giveaways
+WHERE id = $1
+"""
+
+# NOTE: Message IDs are unique across Discord, so this is at most one row.
+_SELECT_GIVEAWAY_BY_MESSAGE_SQL = """
+SELECT
+    guild_id,
+    channel_id,
+    message_id,
+    ends_at,
+    ARRAY(
+        SELECT role_id
+        FROM giveaway_role_rewards
+        WHERE giveaway_id = giveaways.id
+    ) AS role_ids
+FROM giveaways
+WHERE message_id = $1
+LIMIT 1
+"""
+
+# NOTE: The role rewards are gathered per row with a subquery rather than a
+#       JOIN + GROUP BY, so Postgres can stop after `limit` giveaways
+#       instead of aggregating every match before sorting.
+_SELECT_GIVEAWAYS_SQL = """
+SELECT
+    guild_id,
+    channel_id,
+    message_id,
+    ends_at,
+    ARRAY(
+        SELECT role_id
+        FROM giveaway_role_rewards
+        WHERE giveaway_id = giveaways.id
+    ) AS role_ids
+FROM giveaways
+WHERE ($1::bigint IS NULL OR guild_id = $1)
+    AND ($2::bigint IS NULL OR channel_id = $2)
+    AND ($3::timestamptz IS NULL OR (ends_at, id) > ($3, $4::text))
+ORDER BY ends_at, id
+LIMIT $5
+"""
+
+_DELETE_GIVEAWAY_SQL = """
+DELETE FROM giveaways
+WHERE id = $1
+"""
+
+_UPSERT_GIVEAWAY_SQL = """
+INSERT INTO giveaways
+VALUES ($1, $2, $3, $4, $5)
+ON CONFLICT (
+    id
+) DO UPDATE SET
+    id = $1,
+    guild_id = $2,
+    channel_id = $3,
+    message_id = $4,
+    ends_at = $5
+"""
+
+# NOTE: Takes two parallel arrays, the role IDs and their giveaway IDs, so any
+#       number of rewards are inserted with a single query.
+_INSERT_GIVEAWAY_ROLE_REWARDS_SQL = """
+INSERT INTO giveaway_role_rewards
+SELECT *
+FROM UNNEST($1::bigint[], $2::text[])
+ON CONFLICT (role_id, giveaway_id) DO NOTHING
+"""
+
+
+def _make_id(guild_id: int, channel_id: int, message_id: int) -> str:
+    """
+    Unique indentifier for a giveaway, based on the guild ID, channel ID, and
+    message ID combined with a forward slash. This is what `Giveaway._id` is
+    set to.
+
+    Example
+    -------
+    >>> _make_id(123, 456, 789)
+    "123/456/789"
+
+    Returns
+    -------
+    str
+        The unique identifier.
+    """
+
+    return f"{guild_id}/{channel_id}/{message_id}"
+
+
 class GiveawayRoleRewardDict(TypedDict):
     """
     A typed dictionary for the GiveawayReward dataclass.
@@ -18,7 +163,7 @@ class GiveawayRoleRewardDict(TypedDict):
     role_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayRoleReward:
     """
     A givaway role reward dataclass.
@@ -31,6 +176,19 @@ class GiveawayRoleReward:
 
     role_id: int
 
+    @property
+    def mention(self) -> str:
+        """
+        A string that mentions the role being rewarded.
+
+        Returns
+        -------
+        str
+            The mention.
+        """
+
+        return f"<@&{self.role_id}>"
+
     @classmethod
     def from_dict(cls, data: GiveawayRoleRewardDict) -> GiveawayRoleReward:
         return cls(**data)
@@ -49,7 +207,7 @@ class GiveawayDict(TypedDict):
     role_rewards: Optional[List[GiveawayRoleRewardDict]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Giveaway:
     """
     A giveaway data class.
@@ -71,49 +229,50 @@ class Giveaway:
     message_id: int
     ends_at: datetime
     role_rewards: Optional[List[GiveawayRoleReward]] = None
+    _id: str = field(init=False, repr=False, compare=False)
+    _message_url: str = field(init=False, repr=False, compare=False)
+    _ends_at_relative: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    @staticmethod
-    def __generate_id(guild_id: int, channel_id: int, message_id: int) -> str:
-        return f"{guild_id}/{channel_id}/{message_id}"
+    def __post_init__(self) -> None:
+        # NOTE: The IDs never change after the giveaway is created, so the
+        #       unique identifier and URL only need to be built once.
+        self._id = _make_id(self.guild_id, self.channel_id, self.message_id)
+        self._message_url = f"https://discord.com/channels/{self._id}"
 
     @property
-    def _id(self) -> str:
+    def message_url(self) -> str:
         """
-        Unique indentifier for the giveaway, based on the guild ID, channel
-        ID, and message ID combined with a forward slash.
-
-        Example
-        -------
-        >>> Giveaway(
-        ...     123,
-        ...     456,
-        ...     789,
-        ...     datetime.now(),
-        ...     "Classic Nitro"
-        ... )._id
-        "123/456/789"
+        A URL to the giveaway message. Equivelant to
+        `https://discord.com/channels/{self.guild_id}/{self.channel_id}/{self.message_id}`.
 
         Returns
         -------
         str
-            The unique identifier.
+            The URL.
         """
 
-        return self.__generate_id(self.guild_id, self.channel_id, self.message_id)
+        return self._message_url
 
     @property
-    def message_url(self) -> str:
+    def ends_at_relative(self) -> str:
         """
-        Generates a URL to the giveaway message. Equivelant to
-        `https://discord.com/channels/{self.guild_id}/{self.channel_id}/{self.message_id}`.
+        A Discord timestamp showing how long until the giveaway ends, e.g. "in
+        5 minutes". This is cached until `ends_at` changes.
 
         Returns
         -------
         str
-            The URL.
+            The timestamp.
         """
 
-        return f"https://discord.com/channels/{self._id}"
+        if self._ends_at_relative is None or self._ends_at_relative[0] != self.ends_at:
+            self._ends_at_relative = (
+                self.ends_at,
+                discord_utils.format_dt(self.ends_at, style="R"),
+            )
+        return self._ends_at_relative[1]
 
     @classmethod
     def from_dict(cls, data: GiveawayDict) -> Giveaway:
@@ -142,6 +301,33 @@ class Giveaway:
             ],
         )
 
+    @classmethod
+    def from_record(cls, record: Sequence[Any]) -> Giveaway:
+        """
+        Create a new instance of the Giveaway class from a database row,
+        reading its columns by position rather than building a dictionary.
+
+        Parameters
+        ----------
+        record : Sequence[Any]
+            The row, with the columns `guild_id`, `channel_id`, `message_id`,
+            `ends_at` and `role_ids` (an array of the rewarded role IDs), in
+            that order.
+
+        Returns
+        -------
+        Giveaway
+            The new instance of the Giveaway class.
+        """
+
+        return cls(
+            record[0],
+            record[1],
+            record[2],
+            record[3],
+            [GiveawayRoleReward(role_id) for role_id in record[4]],
+        )
+
     @classmethod
     async def from_database(
         cls,
@@ -174,17 +360,13 @@ class Giveaway:
 
         # NOTE: We can pretty safely assume that there's either 0 or 1 entries in this `payload` list.
         payload = await db(
-            """
-            SELECT *
-            FROM giveaways
-            WHERE id = $1
-            """,
-            cls.__generate_id(guild_id, channel_id, message_id),
+            _SELECT_GIVEAWAY_BY_ID_SQL,
+            _make_id(guild_id, channel_id, message_id),
         )
 
         try:
             data = payload[0]
-            return cls.from_dict(data)
+            return cls.from_record(data)
         except IndexError:
             return None
 
@@ -202,39 +384,117 @@ class Giveaway:
         None
         """
 
-        await db(
-            """
-            INSERT INTO giveaways
-            VALUES ($1, $2, $3, $4, $5)
-            ON CONFLICT (
-                id
-            ) DO UPDATE SET
-                id = $1,
-                guild_id = $2,
-                channel_id = $3,
-                message_id = $4,
-                ends_at = $5
-            """,
-            self._id,
-            self.guild_id,
-            self.channel_id,
-            self.message_id,
-            self.ends_at,
-        )
+        # Both statements go in one transaction, so a failure can't leave a
+        # giveaway saved without its rewards.
+        async with db.transaction():
+            await db(
+                _UPSERT_GIVEAWAY_SQL,
+                self._id,
+                self.guild_id,
+                self.channel_id,
+                self.message_id,
+                self.ends_at,
+            )
+
+            if self.role_rewards:
+                # Rewarding the same role twice is easy to do by accident, so
+                # only send each role once.
+                role_ids = list(
+                    dict.fromkeys(reward.role_id for reward in self.role_rewards)
+                )
+                await db(
+                    _INSERT_GIVEAWAY_ROLE_REWARDS_SQL,
+                    role_ids,
+                    [self._id] * len(role_ids),
+                )
+
+        _invalidate_cached_giveaways(self.guild_id, self.channel_id)
+
+    @classmethod
+    async def bulk_update(
+        cls, db: vbu.DatabaseConnection, giveaways: List[Giveaway]
+    ) -> None:
+        """
+        Update the database with the information of many giveaways at once.
+        Large batches are copied into a temporary table and upserted from
+        there.
+
+        The giveaway scheduler isn't told about the new giveaways, so call
+        `Tasks.reschedule_giveaways` afterwards if any of them might end
+        before the ones already saved. Otherwise they're only noticed the next
+        time the scheduler checks the database, which can be up to
+        `GIVEAWAY_SCHEDULER_MAX_SLEEP` seconds late.
+
+        Parameters
+        ----------
+        db : vbu.DatabaseConnection
+            The database connection to use.
+        giveaways : List[Giveaway]
+            The giveaways to update.
 
-        if self.role_rewards is not None:
-            for reward in self.role_rewards:
+        Returns
+        -------
+        None
+        """
+
+        if not giveaways:
+            return
+
+        # NOTE: The same giveaway can't be upserted twice by one statement, so
+        #       only its last entry is kept, same as a run of `update` calls.
+        records = list(
+            {
+                giveaway._id: (
+                    giveaway._id,
+                    giveaway.guild_id,
+                    giveaway.channel_id,
+                    giveaway.message_id,
+                    giveaway.ends_at,
+                )
+                for giveaway in giveaways
+            }.values()
+        )
+        role_ids = []
+        giveaway_ids = []
+        seen_role_rewards = set()
+        for giveaway in giveaways:
+            for reward in giveaway.role_rewards or []:
+                if (reward.role_id, giveaway._id) in seen_role_rewards:
+                    continue
+                seen_role_rewards.add((reward.role_id, giveaway._id))
+                role_ids.append(reward.role_id)
+                giveaway_ids.append(giveaway._id)
+
+        async with db.transaction():
+            if len(records) > BULK_UPDATE_COPY_THRESHOLD:
+                await db(
+                    """
+                    CREATE TEMPORARY TABLE giveaways_import (LIKE giveaways)
+                    ON COMMIT DROP
+                    """
+                )
+                await db.conn.copy_records_to_table("giveaways_import", records=records)
                 await db(
                     """
-                    INSERT INTO giveaway_role_rewards
-                    VALUES ($1, $2)
-                    ON CONFLICT (role_id, giveaway_id) DO UPDATE SET
-                        role_id = $1,
-                        giveaway_id = $2
-                    """,
-                    reward.role_id,
-                    self._id,
+                    INSERT INTO giveaways
+                    SELECT *
+                    FROM giveaways_import
+                    ON CONFLICT (
+                        id
+                    ) DO UPDATE SET
+                        guild_id = EXCLUDED.guild_id,
+                        channel_id = EXCLUDED.channel_id,
+                        message_id = EXCLUDED.message_id,
+                        ends_at = EXCLUDED.ends_at
+                    """
                 )
+            else:
+                await db.executemany(_UPSERT_GIVEAWAY_SQL, *records)
+
+            if role_ids:
+                await db(_INSERT_GIVEAWAY_ROLE_REWARDS_SQL, role_ids, giveaway_ids)
+
+        _giveaways_cache.clear()
 
     async def end(self, db: vbu.DatabaseConnection, bot: vbu.Bot) -> None:
         """
@@ -244,54 +504,149 @@ class Giveaway:
         ----------
         db : vbu.DatabaseConnection
             The database connection to use.
+        bot : vbu.Bot
+            The bot to announce the winner with.
 
         Returns
         -------
         None
         """
 
-        # Delete the giveaway from the database.
-        await db(
-            """
-            DELETE FROM giveaways
-            WHERE id = $1
-            """,
-            self._id,
-        )
+        # Delete the giveaway from the database while the winner is picked,
+        # since neither needs the other.
+        # NOTE: The delete has to succeed before the winner is announced,
+        #       otherwise the giveaway would be ended (and won) again later.
+        delete_task = asyncio.create_task(db(_DELETE_GIVEAWAY_SQL, self._id))
+        try:
+            picked = await self._pick_winner(bot)
+        finally:
+            try:
+                await delete_task
+            finally:
+                _invalidate_cached_giveaways(self.guild_id, self.channel_id)
+
+        if picked is not None:
+            await self._send_winner(*picked)
+
+    async def announce_winner(self, bot: vbu.Bot) -> None:
+        """
+        Pick a winner and reply to the giveaway message with it. This doesn't
+        touch the database, see `end` or `pop_expired` for that.
+
+        Parameters
+        ----------
+        bot : vbu.Bot
+            The bot to announce the winner with.
+
+        Returns
+        -------
+        None
+        """
+
+        picked = await self._pick_winner(bot)
+        if picked is not None:
+            await self._send_winner(*picked)
+
+    async def _pick_winner(
+        self, bot: vbu.Bot
+    ) -> Optional[Tuple[discord.abc.Messageable, Optional[discord.abc.User], int]]:
+        """
+        Pick a winner from the users who reacted to the giveaway message.
+        Returns the channel to announce in, the winner (if anybody joined) and
+        the number of participants, or `None` if the message or its reaction
+        is gone.
+        """
 
         # Respond to the giveaway message with the winner.
-        channel = bot.get_channel(self.channel_id)
-        if channel is None:
-            return
-        try:
-            # ? Reason for seemingly reduntant typehint: For some reason
-            # ? `fetch_message` returns `Any |discord.Message`? Not sure why
-            message: discord.Message = await channel.fetch_message(self.message_id)
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-            return
+        # NOTE: The channel won't be cached for a while after a restart, but
+        #       a partial one is enough to fetch and reply to the message.
+        channel = bot.get_channel(self.channel_id) or bot.get_partial_messageable(
+            self.channel_id, type=discord.ChannelType.text
+        )
 
-        try:
-            reaction = next(
-                reaction for reaction in message.reactions if reaction.emoji == "🎉"
-            )
-        except StopIteration:
-            reaction = None
-        finally:
-            if reaction is None:
-                return
+        # The cached message is only any use if it knows about the giveaway
+        # reaction, otherwise ask Discord for the message.
+        # ? Reason for seemingly reduntant typehint: For some reason
+        # ? `fetch_message` returns `Any |discord.Message`? Not sure why
+        message: Optional[discord.Message] = discord_utils.get(
+            bot.cached_messages, id=self.message_id
+        )
+        if message is None or not any(
+            reaction.emoji == GIVEAWAY_EMOJI for reaction in message.reactions
+        ):
+            try:
+                message = await channel.fetch_message(self.message_id)
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                return None
+
+        reaction = next(
+            (
+                reaction
+                for reaction in message.reactions
+                if reaction.emoji == GIVEAWAY_EMOJI
+            ),
+            None,
+        )
+        if reaction is None:
+            return None
+
+        # Pick the winner with reservoir sampling, so every participant has
+        # the same chance without keeping them all in memory.
+        winner = None
+        participants = 0
+
+        # NOTE: If the bot's own reaction is the only one there's nobody to
+        #       pick from, so skip asking Discord for the users. Otherwise
+        #       every user is needed for a fair pick, and `limit=None` has
+        #       them fetched in the largest pages Discord allows (100).
+        if reaction.count > int(reaction.me):
+            randrange = _winner_random.randrange
+            async for user in reaction.users(limit=None):
+                if user.bot:
+                    continue
+                participants += 1
+                if randrange(participants) == 0:
+                    winner = user
+
+        return channel, winner, participants
+
+    async def _send_winner(
+        self,
+        channel: discord.abc.Messageable,
+        winner: Optional[discord.abc.User],
+        participants: int,
+    ) -> None:
+        """
+        Reply to the giveaway message with the winner picked by `_pick_winner`.
+        """
 
-        participants = [user async for user in reaction.users() if not user.bot]
+        # NOTE: Replying through a reference that doesn't have to exist means
+        #       the winner is still announced if the giveaway message gets
+        #       deleted while the participants are being fetched.
+        reference = discord.MessageReference(
+            message_id=self.message_id,
+            channel_id=self.channel_id,
+            guild_id=self.guild_id,
+            fail_if_not_exists=False,
+        )
 
-        if not participants:
-            await message.reply(
-                f"Nobody joined :< `({len(participants)} participants)`"
+        if winner is None:
+            await channel.send(
+                f"Nobody joined :< `({participants} participants)`",
+                reference=reference,
             )
             return
 
-        winner = random.choice(participants)
-
-        await message.reply(
-            f"**{winner.mention}** has won! ({len(participants)} participants)\ndebug: {self.role_rewards!r}"
+        rewards = ", ".join(reward.mention for reward in self.role_rewards or [])
+        await channel.send(
+            f"**{winner.mention}** has won! ({participants} participants)\n"
+            f"Reward: {rewards or 'nothing lol'}",
+            reference=reference,
+            # NOTE: Only the winner should be pinged, not everyone with the
+            #       reward role.
+            allowed_mentions=discord.AllowedMentions(
+                everyone=False, roles=False, users=[winner]
+            ),
         )
 
 
@@ -315,45 +670,169 @@ async def get_giveaway(db: vbu.DatabaseConnection, id: str) -> Optional[Giveaway
     """
 
     # NOTE: We can pretty safely assume that there's either 0 or 1 entries in this `payload` list.
+    payload = await db(_SELECT_GIVEAWAY_BY_ID_SQL, id)
+
+    try:
+        data = payload[0]
+        return Giveaway.from_record(data)
+    except IndexError:
+        return None
+
+
+async def get_next_giveaway_delay(db: vbu.DatabaseConnection) -> Optional[float]:
+    """
+    Get how long it is until the soonest giveaway ends, measured with the
+    database's clock so it agrees with `pop_expired`.
+
+    Parameters
+    ----------
+    db : vbu.DatabaseConnection
+        The database connection to use.
+
+    Returns
+    -------
+    float
+        The number of seconds until the soonest giveaway ends. This is
+        negative if it has already ended.
+    None
+        If there are no giveaways in the database.
+    """
+
     payload = await db(
         """
-        SELECT *
+        SELECT EXTRACT(EPOCH FROM MIN(ends_at) - NOW()) AS delay
         FROM giveaways
-        WHERE id = $1
-        """,
-        id,
+        """
+    )
+
+    delay = payload[0]["delay"] if payload else None
+    return float(delay) if delay is not None else None
+
+
+async def pop_expired(db: vbu.DatabaseConnection) -> List[Giveaway]:
+    """
+    Delete every giveaway that has ended from the database in a single query.
+
+    Parameters
+    ----------
+    db : vbu.DatabaseConnection
+        The database connection to use.
+
+    Returns
+    -------
+    List[Giveaway]
+        The giveaways that were deleted, with their role rewards.
+    """
+
+    # NOTE: The subquery still sees the role rewards, since every part of the
+    #       statement runs against the snapshot from before the delete.
+    payload = await db(
+        """
+        WITH expired AS (
+            DELETE FROM giveaways
+            WHERE ends_at <= NOW()
+            RETURNING *
+        )
+        SELECT
+            guild_id,
+            channel_id,
+            message_id,
+            ends_at,
+            ARRAY(
+                SELECT role_id
+                FROM giveaway_role_rewards
+                WHERE giveaway_id = expired.id
+            ) AS role_ids
+        FROM expired
+        """
     )
 
+    if payload:
+        _giveaways_cache.clear()
+
+    return [Giveaway.from_record(row) for row in payload]
+
+
+_GiveawaysCacheKey = Tuple[
+    Optional[int], Optional[int], int, Optional[datetime], Optional[str]
+]
+_giveaways_cache: Dict[_GiveawaysCacheKey, Tuple[float, List[Giveaway]]] = {}
+
+
+def _get_cached_giveaways(key: _GiveawaysCacheKey) -> Optional[List[Giveaway]]:
     try:
-        data = payload[0]
-        return Giveaway.from_dict(data)
-    except IndexError:
+        cached_at, giveaways = _giveaways_cache[key]
+    except KeyError:
+        return None
+    if time.monotonic() - cached_at > GIVEAWAYS_CACHE_TTL:
+        del _giveaways_cache[key]
         return None
+    return list(giveaways)
+
+
+def _cache_giveaways(key: _GiveawaysCacheKey, giveaways: List[Giveaway]) -> None:
+    _giveaways_cache.pop(key, None)
+    if len(_giveaways_cache) >= GIVEAWAYS_CACHE_SIZE:
+        # Dictionaries keep their insertion order, so this is the oldest entry.
+        del _giveaways_cache[next(iter(_giveaways_cache))]
+    _giveaways_cache[key] = (time.monotonic(), list(giveaways))
+
+
+def _invalidate_cached_giveaways(guild_id: int, channel_id: int) -> None:
+    """
+    Drop every cached `get_giveaways` result that could include a giveaway
+    in the given guild and channel.
+    """
+
+    for key in list(_giveaways_cache):
+        cached_guild_id, cached_channel_id = key[0], key[1]
+        if cached_guild_id in (guild_id, None) and cached_channel_id in (
+            channel_id,
+            None,
+        ):
+            del _giveaways_cache[key]
 
 
 @overload
 async def get_giveaways(
-    db: vbu.DatabaseConnection, *, guild: Optional[Union[discord.Guild, int]]
+    db: vbu.DatabaseConnection,
+    *,
+    guild: Optional[Union[discord.Guild, int]],
+    limit: int = ...,
+    after: Optional[Giveaway] = ...,
 ) -> Optional[List[Giveaway]]:
     ...
 
 
 @overload
 async def get_giveaways(
-    db: vbu.DatabaseConnection, *, channel: Optional[Union[discord.TextChannel, int]]
+    db: vbu.DatabaseConnection,
+    *,
+    channel: Optional[Union[discord.TextChannel, int]],
+    limit: int = ...,
+    after: Optional[Giveaway] = ...,
 ) -> Optional[List[Giveaway]]:
     ...
 
 
 @overload
 async def get_giveaways(
-    db: vbu.DatabaseConnection, *, message: Optional[Union[discord.PartialMessage, int]]
+    db: vbu.DatabaseConnection,
+    *,
+    message: Optional[Union[discord.PartialMessage, int]],
+    limit: int = ...,
+    after: Optional[Giveaway] = ...,
 ) -> Optional[Giveaway]:
     ...
 
 
 @overload
-async def get_giveaways(db: vbu.DatabaseConnection) -> Optional[List[Giveaway]]:
+async def get_giveaways(
+    db: vbu.DatabaseConnection,
+    *,
+    limit: int = ...,
+    after: Optional[Giveaway] = ...,
+) -> Optional[List[Giveaway]]:
     ...
 
 
@@ -363,9 +842,12 @@ async def get_giveaways(
     guild: Union[discord.Guild, int] = None,
     channel: Union[discord.TextChannel, int] = None,
     message: Union[discord.PartialMessage, int] = None,
+    limit: int = 50,
+    after: Optional[Giveaway] = None,
 ) -> Optional[Union[List[Giveaway], Giveaway]]:
     """
-    Fetch a list of giveaways from the database.
+    Fetch a list of giveaways from the database, ordered by when they end.
+    If `message` is given, only the giveaway on that message is fetched.
 
     Parameters
     ----------
@@ -376,77 +858,197 @@ async def get_giveaways(
     channel : Union[discord.TextChannel, int]
         The channel to fetch giveaways from.
     message : Union[discord.PartialMessage, int]
-        The message to fetch giveaways from.
+        The message to fetch the giveaway of. `limit` and `after` are ignored.
+    limit : int
+        The maximum number of giveaways to fetch, capped at
+        `MAX_GIVEAWAYS_LIMIT`.
+    after : Optional[Giveaway]
+        Only fetch the giveaways that come after this one. Pass the last
+        giveaway of the previous page to fetch the next page.
 
     Returns
     -------
     List[Giveaway]
         The list of giveaways.
+    Giveaway
+        If `message` is given, the giveaway on that message.
+    None
+        If `message` is given and there is no giveaway on it.
 
     Raises
     ------
     ValueError
-        If you don't provide exactly one of `guild`, `channel`, or `message`.
+        If you provide more than one of `guild`, `channel`, or `message`.
     """
 
-    if len([arg for arg in (guild, channel, message) if arg is not None]) > 1:
+    # NOTE: Pages are keyed on `(ends_at, id)` rather than using an OFFSET, so
+    #       later pages are just as cheap to fetch as the first one.
+    limit = min(limit, MAX_GIVEAWAYS_LIMIT)
+    after_ends_at = after.ends_at if after is not None else None
+    after_id = after._id if after is not None else None
+
+    if (guild is not None) + (channel is not None) + (message is not None) > 1:
         raise ValueError(
             "Must provide at most one of `guild`, `channel`, or `message`."
         )
 
-    elif guild is not None:
-        guild_id = guild.id if isinstance(guild, discord.Guild) else guild
-        payload = await db(
+    # NOTE: Anything with an `id` is treated as the object itself, so threads,
+    #       partial guilds, etc. work too.
+    guild_id = getattr(guild, "id", guild)
+    channel_id = getattr(channel, "id", channel)
+    message_id = getattr(message, "id", message)
+
+    # Message lookups are pretty much always one-offs, so they skip the cache
+    # and go straight to the single row they're after.
+    if message_id is not None:
+        payload = await db(_SELECT_GIVEAWAY_BY_MESSAGE_SQL, message_id)
+        return Giveaway.from_record(payload[0]) if payload else None
+
+    cache_key: _GiveawaysCacheKey = (
+        guild_id,
+        channel_id,
+        limit,
+        after_ends_at,
+        after_id,
+    )
+    cached = _get_cached_giveaways(cache_key)
+    if cached is not None:
+        return cached
+
+    payload = await db(
+        _SELECT_GIVEAWAYS_SQL,
+        guild_id,
+        channel_id,
+        after_ends_at,
+        after_id,
+        limit,
+    )
+
+    giveaways = [Giveaway.from_record(row) for row in payload]
+    _cache_giveaways(cache_key, giveaways)
+    return giveaways
+
+
+async def iter_giveaways(
+    db: vbu.DatabaseConnection,
+    *,
+    guild: Union[discord.Guild, int] = None,
+    channel: Union[discord.TextChannel, int] = None,
+) -> AsyncIterator[Giveaway]:
+    """
+    Stream giveaways from the database with a server-side cursor, ordered by
+    when they end. Unlike `get_giveaways` there's no limit, but only a batch
+    of rows is held in memory at a time. The connection is kept in a
+    transaction until the iterator is exhausted or closed.
+
+    Parameters
+    ----------
+    db : vbu.DatabaseConnection
+        The database connection to use.
+    guild : Union[discord.Guild, int]
+        The guild to fetch giveaways from.
+    channel : Union[discord.TextChannel, int]
+        The channel to fetch giveaways from.
+
+    Yields
+    ------
+    Giveaway
+        The giveaways, with their role rewards.
+
+    Raises
+    ------
+    ValueError
+        If you provide both `guild` and `channel`.
+    """
+
+    if guild is not None and channel is not None:
+        raise ValueError("Must provide at most one of `guild` or `channel`.")
+
+    guild_id = getattr(guild, "id", guild)
+    channel_id = getattr(channel, "id", channel)
+
+    async with db.transaction():
+        async for row in db.conn.cursor(
             """
-            SELECT *
+            SELECT
+                guild_id,
+                channel_id,
+                message_id,
+                ends_at,
+                ARRAY(
+                    SELECT role_id
+                    FROM giveaway_role_rewards
+                    WHERE giveaway_id = giveaways.id
+                ) AS role_ids
             FROM giveaways
-            WHERE guild_id = $1
+            WHERE ($1::bigint IS NULL OR guild_id = $1)
+                AND ($2::bigint IS NULL OR channel_id = $2)
+            ORDER BY ends_at, id
             """,
             guild_id,
-        )
-    elif channel is not None:
-        channel_id = channel.id if isinstance(channel, discord.TextChannel) else channel
-        payload = await db(
-            """
-            SELECT *
-            FROM giveaways
-            WHERE channel_id = $1
-            """,
             channel_id,
-        )
-    elif message is not None:
-        message_id = (
-            message.id if isinstance(message, discord.PartialMessage) else message
-        )
-        payload = await db(
-            """
-            SELECT *
-            FROM giveaways
-            WHERE message_id = $1
-            """,
-            message_id,
-        )
-    else:
+        ):
+            yield Giveaway.from_record(row)
+
+
+async def count_giveaways(
+    db: vbu.DatabaseConnection,
+    *,
+    guild: Union[discord.Guild, int] = None,
+    channel: Union[discord.TextChannel, int] = None,
+) -> int:
+    """
+    Count the giveaways in a guild or channel. If counting takes longer than
+    `COUNT_GIVEAWAYS_TIMEOUT`, Postgres' estimate of the number of rows in the
+    whole giveaways table is returned instead, so treat the result as a
+    display value only.
+
+    Parameters
+    ----------
+    db : vbu.DatabaseConnection
+        The database connection to use.
+    guild : Union[discord.Guild, int]
+        The guild to count giveaways in.
+    channel : Union[discord.TextChannel, int]
+        The channel to count giveaways in.
+
+    Returns
+    -------
+    int
+        The (possibly estimated) number of giveaways.
+
+    Raises
+    ------
+    ValueError
+        If you provide both `guild` and `channel`.
+    """
+
+    if guild is not None and channel is not None:
+        raise ValueError("Must provide at most one of `guild` or `channel`.")
+
+    guild_id = getattr(guild, "id", guild)
+    channel_id = getattr(channel, "id", channel)
+
+    try:
+        async with db.transaction():
+            await db(f"SET LOCAL statement_timeout = '{COUNT_GIVEAWAYS_TIMEOUT}'")
+            payload = await db(
+                """
+                SELECT COUNT(*)
+                FROM giveaways
+                WHERE ($1::bigint IS NULL OR guild_id = $1)
+                    AND ($2::bigint IS NULL OR channel_id = $2)
+                """,
+                guild_id,
+                channel_id,
+            )
+    except asyncpg.QueryCanceledError:
         payload = await db(
             """
-            SELECT * FROM giveaways
+            SELECT reltuples::bigint AS count
+            FROM pg_class
+            WHERE relname = 'giveaways'
             """
         )
 
-    payload = {row["id"]: dict(row) for row in payload}
-    payload_role_rewards = await db(
-        """
-        SELECT *
-        FROM giveaway_role_rewards
-        WHERE giveaway_id = ANY($1::text[])
-        """,
-        list(payload),
-    )
-    for row in payload_role_rewards:
-        payload_row = payload[row["giveaway_id"]]
-        try:
-            payload_row["role_rewards"].append({"role_id": row["role_id"]})
-        except KeyError:
-            payload_row["role_rewards"] = [{"role_id": row["role_id"]}]
-
-    return [Giveaway.from_dict(data) for data in payload.values()]
+    return max(payload[0]["count"], 0) if payload else 0